@@ -0,0 +1,181 @@
+import math
+import random
+import time
+
+import profiling
+from game_state import DISCARD, ONE_EYED_JACK, PLACE, PLAYER_CHIPS
+
+PROGRESS_INTERVAL = 64   # search iterations between progress callbacks
+
+
+@profiling.phase('ai.choose_move')
+def choose_move(state, difficulty, rng=random):
+    moves = state.legal_moves()
+    if not moves:
+        return None
+    hand = list(state.hands[state.current_player])
+    by_card = {}
+    for move in moves:
+        if move.kind != DISCARD:
+            by_card.setdefault(move.card, []).append(move)
+
+    if difficulty == "Easy":
+        rng.shuffle(hand)
+    elif difficulty == "Medium":
+        hand.sort()
+
+    if difficulty == "Hard":
+        # Try smart move first
+        chip = PLAYER_CHIPS[state.current_player]
+        for card in hand:
+            for move in by_card.get(card, ()):
+                if move.kind == PLACE and state.possible_sequence(move.row, move.col, chip):
+                    return move
+
+        removals = by_card.get(ONE_EYED_JACK)
+        if removals:
+            return rng.choice(removals)
+
+    # Fallback normal move for all difficulties (common logic)
+    for card in hand:
+        card_moves = by_card.get(card)
+        if card_moves:
+            if card == ONE_EYED_JACK:
+                return rng.choice(card_moves)
+            return card_moves[0]
+
+    return rng.choice(moves)
+
+
+class MCTSPlayer:
+    """Monte Carlo tree search over sampled opponent hands and deck orders.
+
+    Nodes live in a transposition table keyed by the searching player's Zobrist
+    key, so statistics gathered on one turn are reused on the next.
+    """
+
+    def __init__(self, time_budget=0.5, max_iterations=None, rollout_depth=6,
+                 exploration=0.7, max_nodes=200000, rng=None):
+        if time_budget is None and max_iterations is None:
+            raise ValueError("MCTSPlayer needs a time_budget, max_iterations or both")
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.rollout_depth = rollout_depth
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.rng = rng or random.Random()
+        self.table = {}
+        self.last_iterations = 0
+        self.last_depth = 0
+        self._cards = None
+
+    @profiling.phase('ai.search')
+    def choose_move(self, state, should_stop=None, progress=None):
+        # should_stop() aborts the search early; progress(iterations, depth) reports on it
+        moves = state.legal_moves()
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+        if state.cards is not self._cards or len(self.table) > self.max_nodes:
+            # New board, or the table outgrew its budget: start a fresh tree
+            self.table.clear()
+            self._cards = state.cards
+
+        player = state.current_player
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        iterations = 0
+        self.last_depth = 0
+        while self.max_iterations is None or iterations < self.max_iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if should_stop is not None and should_stop():
+                break
+            self._iterate(state, player)
+            iterations += 1
+            if progress is not None and iterations % PROGRESS_INTERVAL == 0:
+                progress(iterations, self.last_depth)
+        self.last_iterations = iterations
+
+        node = self.table.get(state.zobrist_key(player))
+        if node is None:
+            return choose_move(state, "Hard", self.rng)
+        stats = node[1]
+        return max(moves, key=lambda move: stats[move][0] if move in stats else -1)
+
+    def _determinize(self, state, player):
+        # Everything the searching player cannot see gets reshuffled
+        opponent = 1 - player
+        hidden = state.hands[opponent] + state.deck
+        self.rng.shuffle(hidden)
+        size = len(state.hands[opponent])
+        state.hands[opponent] = hidden[:size]
+        state.deck = hidden[size:]
+
+    def _iterate(self, root, player):
+        state = root.copy()
+        self._determinize(state, player)
+        path = []
+
+        # Selection / expansion
+        while not state.is_over:
+            key = state.zobrist_key(player)
+            node = self.table.get(key)
+            moves = state.legal_moves()
+            if node is None:
+                node = self.table[key] = [0, {}]
+                move = self.rng.choice(moves)
+                stats = node[1].setdefault(move, [0, 0.0, 0])
+                stats[2] += 1
+                path.append((node, stats, state.current_player))
+                state.apply(move)
+                break
+            move, stats = self._select(node, moves)
+            path.append((node, stats, state.current_player))
+            state.apply(move)
+
+        # Short random playout, then score the position
+        for _ in range(self.rollout_depth):
+            if state.is_over:
+                break
+            state.apply(self.rng.choice(state.legal_moves()))
+        value = evaluate(state, player)
+        self.last_depth = max(self.last_depth, len(path))
+        if profiling.ENABLED:
+            profiling.count('ai_playouts')
+            profiling.count('ai_nodes_visited', len(path))
+
+        for node, stats, mover in path:
+            node[0] += 1
+            stats[0] += 1
+            stats[1] += value if mover == player else 1.0 - value
+
+    def _select(self, node, moves):
+        # UCB1 with availability counts, since sampled hands change which moves exist
+        table = node[1]
+        best = None
+        best_score = -1.0
+        for move in moves:
+            stats = table.get(move)
+            if stats is None:
+                stats = table[move] = [0, 0.0, 0]
+            stats[2] += 1
+            if stats[0] == 0:
+                score = 2.0 + self.rng.random()
+            else:
+                score = stats[1] / stats[0] + self.exploration * math.sqrt(math.log(stats[2]) / stats[0])
+            if score > best_score:
+                best, best_score = move, score
+        return best, table[best]
+
+
+def evaluate(state, player):
+    # Win probability estimate for `player` from sequences and open threats
+    if state.winner is not None:
+        return 1.0 if state.winner == player else 0.0
+    if state.drawn:
+        return 0.5
+    chip = PLAYER_CHIPS[player]
+    rival = PLAYER_CHIPS[1 - player]
+    margin = (1.5 * (state.scores[player] - state.scores[1 - player])
+              + 0.5 * (state.count_threats(chip, 1) - state.count_threats(rival, 1))
+              + 0.1 * (state.count_threats(chip, 2) - state.count_threats(rival, 2)))
+    return 1.0 / (1.0 + math.exp(-margin))
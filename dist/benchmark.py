@@ -0,0 +1,203 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from ai_player import MCTSPlayer, choose_move
+from game_state import PLAYER_CHIPS, new_game
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.25   # fail when a case gets more than 25% slower than the baseline
+
+
+def midgame(seed=7, plies=40):
+    # Fixed, seeded position with a busy board for the per-operation cases
+    state = new_game(seed)
+    rng = random.Random(seed)
+    for _ in range(plies):
+        if state.is_over:
+            break
+        state.apply(choose_move(state, "Medium", rng))
+    return state
+
+
+def bench_find_sequence():
+    state = midgame()
+    chip = PLAYER_CHIPS[state.current_player]
+    cells = [divmod(cell, 10) for cell in range(100)]
+    return lambda: [state.find_sequence(row, col, chip) for row, col in cells], len(cells)
+
+
+def bench_count_threats():
+    state = midgame()
+    return lambda: state.count_threats(PLAYER_CHIPS[0]), 1
+
+
+def bench_legal_moves():
+    state = midgame()
+    return state.legal_moves, 1
+
+
+def bench_has_valid_moves():
+    state = midgame()
+    return lambda: (state.has_valid_moves(0), state.has_valid_moves(1)), 2
+
+
+def bench_apply_undo():
+    state = midgame()
+    moves = state.legal_moves()
+
+    def run():
+        for move in moves:
+            state.apply(move)
+            state.undo(move)
+    return run, len(moves)
+
+
+def bench_ai(difficulty):
+    def setup():
+        state = midgame()
+        rng = random.Random(1)
+        return lambda: choose_move(state, difficulty, rng), 1
+    return setup
+
+
+def bench_ai_hard():
+    state = midgame()
+
+    def run():
+        # Fixed iteration count (not a time budget) so the work per call is constant
+        MCTSPlayer(time_budget=None, max_iterations=200, rng=random.Random(1)).choose_move(state)
+    return run, 1
+
+
+def bench_full_game():
+    def run():
+        for seed in range(5):
+            state = new_game(seed)
+            rng = random.Random(seed)
+            while not state.is_over:
+                state.apply(choose_move(state, "Medium", rng))
+    return run, 5
+
+
+CASES = {
+    'find_sequence': bench_find_sequence,
+    'count_threats': bench_count_threats,
+    'legal_moves': bench_legal_moves,
+    'has_valid_moves': bench_has_valid_moves,
+    'apply_undo': bench_apply_undo,
+    'ai_easy': bench_ai("Easy"),
+    'ai_medium': bench_ai("Medium"),
+    'ai_greedy': bench_ai("Hard"),
+    'ai_hard_200_iterations': bench_ai_hard,
+    'full_game_medium': bench_full_game,
+}
+
+
+def measure(setup, min_time=0.2, repeat=5):
+    func, ops = setup()
+    # Calibrate the loop count so one sample takes at least min_time / repeat
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / (loops * ops) * 1e6
+
+
+def run_cases(names, min_time):
+    results = {}
+    for name in names:
+        results[name] = round(measure(CASES[name], min_time), 3)
+        print(f"{name:<26} {results[name]:>14.3f} us/op")
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, value in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = value / reference - 1
+        marker = "REGRESSION" if change > threshold else ""
+        print(f"{name:<26} {reference:>12.3f} -> {value:>12.3f} us/op {change:>+8.1%} {marker}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Sequence rules and AI hot paths.")
+    parser.add_argument('cases', nargs='*', help="cases to run (default: all): " + ", ".join(CASES))
+    parser.add_argument('--baseline', help="baseline JSON file (default: benchmark_baseline.json); "
+                                           "given explicitly, it is checked even if recorded elsewhere")
+    parser.add_argument('--save', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing, as a fraction (default 0.25)")
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds to spend per case")
+    parser.add_argument('--json', help="also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error("unknown case(s): " + ", ".join(unknown))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline_path = args.baseline or BASELINE_PATH
+    results = run_cases(args.cases or list(CASES), args.min_time)
+    record = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'unit': 'us/op',
+        'results': results,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(record, file, indent=2)
+    if args.save:
+        with open(baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(record, file, indent=2)
+            file.write("\n")
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+    if not os.path.exists(baseline_path):
+        print(f"No baseline at {baseline_path}; run with --save to create one.")
+        return 0
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = json.load(file)
+    print()
+    recorded_on = (baseline.get('python'), baseline.get('machine'))
+    if recorded_on != (record['python'], record['machine']) and not args.baseline:
+        # Timings from another interpreter or machine say nothing about a regression here
+        print(f"Warning: the baseline was recorded on Python {recorded_on[0]}/{recorded_on[1]}, "
+              f"this is Python {record['python']}/{record['machine']}.")
+        print("Skipping the regression check; run with --save to record a baseline on this machine, "
+              "or pass --baseline to compare anyway.")
+        return 0
+    regressions = compare(results, baseline['results'], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}: "
+              + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
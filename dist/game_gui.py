@@ -0,0 +1,723 @@
+import os
+import traceback
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QGridLayout, QDialog, QLineEdit,
+    QCheckBox, QComboBox, QFileDialog, QScrollArea, QSlider, QSpinBox, QStackedLayout
+)
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal, QEvent
+from PySide6.QtCore import QPropertyAnimation, QEasingCurve
+from PySide6.QtGui import QFont, QPixmap
+
+import profiling
+from ai_player import MCTSPlayer, choose_move
+from game_record import RecordError, RecordWriter, Replay, load_game, record_of, save_game
+from game_state import (
+    CORNER, CORNER_POSITIONS, DISCARD, EMPTY, ONE_EYED_JACK, PLACE, REMOVE,
+    BLUE, GREEN, LOCKED, Move, new_game
+)
+
+# The game in progress is streamed here move by move, so it survives a crash
+AUTOSAVE_PATH = os.path.join(os.path.expanduser("~"), "sequence_autosave.seqr")
+
+CHIP_TEXT = {BLUE: '🔵', GREEN: '🟢', LOCKED: '🔴'}
+
+# One shared stylesheet; cells and hand cards only flip dynamic properties
+BOARD_STYLE = """
+QPushButton[suit="red"] { color: red; }
+QPushButton[suit="black"] { color: black; }
+QPushButton[corner="true"] { background-color: lightgreen; }
+QPushButton[removable="true"] { border: 2px solid yellow; }
+QPushButton[dead="true"] { text-decoration: line-through; }
+"""
+
+
+def card_suit(card):
+    return "red" if '♦' in card or '♥' in card else "black"
+
+
+def repolish(widget):
+    # Re-evaluate the shared stylesheet after a property change; nothing is re-parsed
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class BoardRenderer:
+    # Diffs every cell against what was last drawn and only touches the widgets that changed
+    def __init__(self, buttons):
+        self.buttons = [btn for row in buttons for btn in row]
+        self.shown = [None] * len(self.buttons)
+
+    @profiling.phase('render.board')
+    def render(self, state, removable=(), locked=False):
+        for cell, btn in enumerate(self.buttons):
+            card = state.cards[cell]
+            chip = state.board[cell]
+            is_removable = cell in removable
+            view = (CHIP_TEXT.get(chip, card), (chip == EMPTY or is_removable) and not locked,
+                    card_suit(card), chip == CORNER, is_removable)
+            old = self.shown[cell]
+            if view == old:
+                continue
+            self.shown[cell] = view
+            if profiling.ENABLED:
+                profiling.count('cells_repainted')
+            if old is None or old[0] != view[0]:
+                btn.setText(view[0])
+            if old is None or old[1] != view[1]:
+                btn.setEnabled(view[1])
+            if old is None or old[2:] != view[2:]:
+                btn.setProperty("suit", view[2])
+                btn.setProperty("corner", view[3])
+                btn.setProperty("removable", view[4])
+                repolish(btn)
+
+
+class HandRenderer:
+    # Reuses one button per hand slot instead of rebuilding the hand every turn
+    def __init__(self, layout, on_select):
+        self.layout = layout
+        self.on_select = on_select
+        self.slots = []
+        self.shown = []
+
+    @profiling.phase('render.hand')
+    def render(self, cards, hidden, dead=()):
+        while len(self.slots) < len(cards):
+            btn = QPushButton()
+            btn.setFont(QFont("Arial", 10, QFont.Bold))
+            btn.clicked.connect(lambda _, i=len(self.slots): self.on_select(i))
+            self.layout.addWidget(btn)
+            self.slots.append(btn)
+            self.shown.append(None)
+
+        for index, btn in enumerate(self.slots):
+            if index >= len(cards):
+                view = ("", False, "black", False, False)
+            elif hidden:
+                view = ("🎴", False, "black", True, False)
+            else:
+                view = (cards[index], True, card_suit(cards[index]), True, cards[index] in dead)
+            old = self.shown[index]
+            if view == old:
+                continue
+            self.shown[index] = view
+            if old is None or old[0] != view[0]:
+                btn.setText(view[0])
+            if old is None or old[1] != view[1]:
+                btn.setEnabled(view[1])
+            if old is None or old[2] != view[2] or old[4] != view[4]:
+                btn.setProperty("suit", view[2])
+                btn.setProperty("dead", view[4])
+                repolish(btn)
+            if old is None or old[3] != view[3]:
+                btn.setVisible(view[3])
+
+
+class AIWorkerSignals(QObject):
+    progress = Signal(int, int, int)   # generation, iterations, depth
+    finished = Signal(int, object)     # generation, move
+
+
+class AIWorker(QRunnable):
+    # Picks the AI move on a pool thread from a snapshot of the game state
+    def __init__(self, state, difficulty, search_player, generation):
+        super().__init__()
+        self.state = state
+        self.difficulty = difficulty
+        self.search_player = search_player
+        self.generation = generation
+        self.cancelled = False
+        self.signals = AIWorkerSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            if self.search_player is not None:
+                move = self.search_player.choose_move(
+                    self.state,
+                    should_stop=lambda: self.cancelled,
+                    progress=lambda iterations, depth: self.signals.progress.emit(self.generation, iterations, depth)
+                )
+            else:
+                move = choose_move(self.state, self.difficulty)
+        except Exception:
+            # Always report back, or the GUI would wait for this turn forever
+            traceback.print_exc()
+            move = None
+        if not self.cancelled:
+            self.signals.finished.emit(self.generation, move)
+
+
+class SequenceGameGUI(QWidget):
+    def __init__(self, settings):
+        super().__init__()
+        self.setWindowTitle("🎯 Sequence Game")
+
+        self.players = settings['players']
+        self.vs_ai = settings['vs_ai']
+        self.ai_difficulty = settings['ai_difficulty']
+        self.search_player = None
+        self.ai_worker = None
+        self.ai_generation = 0
+        if self.ai_difficulty == "Hard":
+            # Search time per move; it starts after the 700 ms turn delay and runs on a worker thread
+            self.search_player = MCTSPlayer(time_budget=settings.get('ai_think_ms', 500) / 1000)
+        self.win_label = None
+        self.loss_label = None
+        self.draw_label = None
+        self.help_dialog = None
+        self.state = new_game()
+        self.replay = Replay(record_of(self.state), self.state)
+        self.board_layout = self.state.board_layout
+        self.timeline = self.replay.record.moves   # the whole line of play, including moves seeked back past
+
+        self.corner_positions = CORNER_POSITIONS
+        self.removable_positions = set()
+        self.board_locked = False
+        self.autosave_file = None
+        self.autosave = None
+
+        self.init_ui()
+        self.removal_mode = True
+        self.selected_card = None
+        self.update_hand()
+        self.start_autosave()
+        self.ai_play_if_needed()
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        container = QWidget()
+        container.setStyleSheet(BOARD_STYLE)
+        layout = QVBoxLayout(container)
+        self.score_label = QLabel(self.get_score_text())
+        self.score_label.setFont(QFont("Arial", 12, QFont.Bold))
+        layout.addWidget(self.score_label)
+        self.grid = QGridLayout()
+        self.board_buttons = []
+        for r in range(10):
+            row_buttons = []
+            for c in range(10):
+                card = self.board_layout[r][c]
+                btn = QPushButton(card)
+                btn.setFixedSize(60, 60)
+                btn.setFont(QFont("Arial", 10, QFont.Bold))
+                btn.clicked.connect(lambda _, row=r, col=c: self.place_marker(row, col))
+                self.grid.addWidget(btn, r, c)
+                row_buttons.append(btn)
+            self.board_buttons.append(row_buttons)
+        layout.addLayout(self.grid)
+        self.board_renderer = BoardRenderer(self.board_buttons)
+        self.sync_board()
+
+        self.hand_layout = QHBoxLayout()
+        layout.addLayout(self.hand_layout)
+        self.hand_renderer = HandRenderer(self.hand_layout, self.select_card)
+        self.turn_label = QLabel()
+        self.turn_label.setFont(QFont("Arial", 11))
+        layout.addWidget(self.turn_label)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        self.deck_label = QLabel()
+        layout.addWidget(self.deck_label)
+
+        button_row = QHBoxLayout()
+
+        self.restart_button = QPushButton("🔄 Restart Game")
+        self.restart_button.setVisible(True)
+        self.restart_button.clicked.connect(self.restart_game)
+        button_row.addWidget(self.restart_button)
+
+        self.help_button = QPushButton("❓ Help / How to Play")
+        self.help_button.clicked.connect(self.show_help)
+        button_row.addWidget(self.help_button)
+
+        layout.addLayout(button_row)
+
+        record_row = QHBoxLayout()
+
+        self.save_button = QPushButton("💾 Save Game")
+        self.save_button.clicked.connect(self.save_game)
+        record_row.addWidget(self.save_button)
+
+        self.load_button = QPushButton("📂 Load Game")
+        self.load_button.clicked.connect(self.load_game)
+        record_row.addWidget(self.load_button)
+
+        self.turn_slider = QSlider(Qt.Horizontal)
+        self.turn_slider.setRange(0, 0)
+        self.turn_slider.valueChanged.connect(self.seek_turn)
+        record_row.addWidget(self.turn_slider)
+
+        self.turn_position_label = QLabel()
+        record_row.addWidget(self.turn_position_label)
+
+        self.resume_button = QPushButton("▶ Play From Here")
+        self.resume_button.setEnabled(False)
+        self.resume_button.clicked.connect(self.play_from_here)
+        record_row.addWidget(self.resume_button)
+
+        layout.addLayout(record_row)
+
+        scroll.setWidget(container)
+        main_layout.addWidget(scroll)
+
+    def sync_board(self):
+        # Widgets only mirror self.state; they never hold game state themselves
+        removable = {r * 10 + c for r, c in self.removable_positions}
+        self.board_renderer.render(self.state, removable, self.board_locked)
+
+    def show_help(self):
+        # The guide is only imported and built the first time it is opened
+        if self.help_dialog is None:
+            from help_dialog import HelpDialog
+            self.help_dialog = HelpDialog()
+        self.help_dialog.exec()
+
+    def get_score_text(self):
+        scores = self.state.scores
+        return f"Sequences - {self.players[0]}: {scores[0]} | {self.players[1]}: {scores[1]}"
+
+    def play_status_animation(self, color):
+        animation = QPropertyAnimation(self.status_label, b"styleSheet")
+        animation.setDuration(1200)
+        animation.setStartValue("color: black;")
+        animation.setEndValue(f"color: {color}; font-weight: bold; font-size: 18px;")
+        animation.setEasingCurve(QEasingCurve.InOutQuad)
+        animation.start(QPropertyAnimation.DeleteWhenStopped)
+
+    def update_hand(self):
+        hand = self.state.hands[self.state.current_player]
+        hidden = self.vs_ai and self.state.current_player == 1
+        dead = () if hidden else {move.card for move in self.state.legal_moves() if move.kind == DISCARD}
+        self.hand_renderer.render(hand, hidden, dead)
+
+        self.turn_label.setText(f"{self.players[self.state.current_player]}'s Turn")
+        self.update_turn_slider()
+        self.deck_label.setText(f"Cards left in Deck: {len(self.state.deck)}")
+        self.score_label.setText(self.get_score_text())
+
+    def update_turn_slider(self):
+        turn = len(self.state.history)
+        self.turn_slider.blockSignals(True)
+        self.turn_slider.setRange(0, len(self.timeline))
+        self.turn_slider.setValue(turn)
+        self.turn_slider.blockSignals(False)
+        self.turn_position_label.setText(f"Move {turn} / {len(self.timeline)}")
+        self.resume_button.setEnabled(turn < len(self.timeline))
+
+    def select_card(self, idx):
+        card = self.state.hands[self.state.current_player][idx]
+        discard = Move(DISCARD, card, -1, -1)
+        if self.state.is_legal(discard):
+            # Dead card (both board spaces taken): clicking it swaps it for a new one
+            self.play_move(discard)
+            return
+        self.selected_card = card
+        self.status_label.setText(f"Selected: {self.selected_card}")
+
+        if self.selected_card == ONE_EYED_JACK:
+            self.highlight_removable_chips()
+            self.removal_mode = True  # Enter removal mode
+        else:
+            self.clear_highlights()
+            self.removal_mode = False  # Normal mode
+
+    def place_marker(self, row, col):
+        if self.removal_mode:
+            if (row, col) in self.removable_positions:
+                self.perform_removal(row, col)
+            else:
+                self.status_label.setText("Select a highlighted chip to remove.")
+            return
+
+        if not self.selected_card:
+            self.status_label.setText("Select a card first.")
+            return
+
+        if self.state.chip_at(row, col) != EMPTY:
+            self.status_label.setText("Spot already taken or locked.")
+            return
+
+        move = Move(PLACE, self.selected_card, row, col)
+        if self.state.is_legal(move):
+            self.play_move(move)
+        else:
+            self.status_label.setText("Card doesn't match this space.")
+
+    def play_move(self, move):
+        player = self.state.current_player
+        score = self.state.scores[player]
+        if len(self.timeline) > len(self.state.history):
+            del self.timeline[len(self.state.history):]   # a new move replaces any moves seeked past
+            self.start_autosave()
+        self.state.apply(move)
+        self.timeline.append(move)
+        self.autosave_move(move)
+        self.selected_card = None
+        self.removal_mode = False
+        self.removable_positions.clear()
+        self.sync_board()
+
+        if move.kind == REMOVE:
+            self.status_label.setText(f"{self.players[player]} removed opponent's chip!")
+        elif move.kind == DISCARD:
+            # Dead card swapped for a new one; the same player still has to play
+            self.status_label.setText(f"{self.players[player]} replaced a dead card.")
+        if self.state.scores[player] > score:
+            self.status_label.setText(f"{self.players[player]} completed a sequence!")
+            self.play_status_animation("blue")
+
+        self.update_hand()
+        self.show_result()
+
+    def show_result(self):
+        winner = self.state.winner
+        if winner is not None:
+            self.status_label.setText(f"🏆 {self.players[winner]} wins the game!")
+            self.play_status_animation("green")
+            self.play_win_animation(winner)
+            self.play_loss_animation(loser=1 - winner)
+            self.disable_all_buttons()
+        elif self.state.drawn:
+            if self.draw_label is None:
+                self.play_draw_animation()
+        else:
+            self.ai_play_if_needed()
+
+    def play_loss_animation(self, loser):
+        if self.loss_label is not None:
+            self.loss_label.deleteLater()
+        self.loss_label = QLabel(f"💔 {self.players[loser]} Lost! 💔")
+        self.loss_label.setFont(QFont("Arial", 22, QFont.Bold))
+        self.loss_label.setStyleSheet("color: red; background-color: white;")
+        self.loss_label.setAlignment(Qt.AlignCenter)
+        self.layout().addWidget(self.loss_label)
+
+    def play_win_animation(self, winner):
+        if self.win_label is not None:
+            self.win_label.deleteLater()
+        self.win_label = QLabel(f"🏆 {self.players[winner]} Wins! 🏆")
+        self.win_label.setFont(QFont("Arial", 24, QFont.Bold))
+        self.win_label.setStyleSheet("color: gold; background-color: white;")
+        self.win_label.setAlignment(Qt.AlignCenter)
+        self.layout().addWidget( self.win_label)
+
+    def disable_all_buttons(self):
+        self.board_locked = True
+        self.sync_board()
+        self.restart_button.setVisible(True)
+
+    def restart_game(self):
+        state = new_game()
+        self.start_game(Replay(record_of(state), state))
+        self.ai_play_if_needed()
+
+    def start_game(self, replay):
+        self.cancel_ai()
+        if self.search_player is not None:
+            # A cancelled search may still be unwinding on the pool thread; don't share its table
+            self.search_player = MCTSPlayer(time_budget=self.search_player.time_budget)
+        self.replay = replay
+        self.state = replay.state
+        self.board_layout = self.state.board_layout
+        self.timeline = replay.record.moves
+        self.board_locked = False
+        self.removable_positions.clear()
+        self.sync_board()
+        self.clear_result_labels()
+
+        self.selected_card = None
+        self.removal_mode = False
+        self.status_label.setText("")
+        self.restart_button.setVisible(True)
+        self.help_button.setVisible(True)
+        self.update_hand()
+        self.start_autosave()
+
+    def clear_result_labels(self):
+        if self.win_label:
+            self.win_label.deleteLater()
+            self.win_label = None
+        if self.loss_label:
+            self.loss_label.deleteLater()
+            self.loss_label = None
+        if self.draw_label:
+            self.draw_label.deleteLater()
+            self.draw_label = None
+
+    def save_game(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Game", "", "Sequence games (*.seqr)")
+        if not path:
+            return
+        try:
+            # The whole timeline, not just up to the move the slider is showing
+            save_game(path, self.replay.record)
+        except OSError as error:
+            self.status_label.setText(f"Could not save game: {error}")
+            return
+        self.status_label.setText(f"Game saved ({len(self.timeline)} moves).")
+
+    def load_game(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Game", "", "Sequence games (*.seqr)")
+        if not path:
+            return
+        try:
+            # Replay and check the whole record before the current game is touched
+            record = load_game(path)
+            replay = Replay(record)
+            replay.seek(len(record.moves))
+        except (OSError, RecordError) as error:
+            self.status_label.setText(f"Could not load game: {error}")
+            return
+        self.start_game(replay)
+        self.show_result()
+
+    def seek_turn(self, turn):
+        # Steps from the shown turn to `turn` with apply/undo, never replaying from the start
+        self.cancel_ai()
+        self.replay.seek(turn)
+
+        self.selected_card = None
+        self.removal_mode = False
+        self.removable_positions.clear()
+        self.clear_result_labels()
+        self.board_locked = False
+        self.status_label.setText("")
+        self.sync_board()
+        self.update_hand()
+        if len(self.state.history) == len(self.timeline):
+            self.show_result()
+        else:
+            # Looking back never resumes the AI: that would overwrite the later moves
+            self.status_label.setText("Viewing an earlier move. Play a move or press ▶ Play From Here to continue.")
+
+    def play_from_here(self):
+        # Drops the moves after the shown turn and carries on from this position
+        del self.timeline[len(self.state.history):]
+        self.start_autosave()
+        self.status_label.setText("")
+        self.update_turn_slider()
+        self.show_result()
+
+    def highlight_removable_chips(self):
+        self.removable_positions = set(self.state.removable_positions())
+        self.sync_board()
+
+    def clear_highlights(self):
+        if self.removable_positions:
+            self.removable_positions.clear()
+            self.sync_board()
+
+    def play_draw_animation(self):
+        if self.draw_label is not None:
+            self.draw_label.deleteLater()
+        self.draw_label = QLabel("🤝 Match Drawn 🤝")
+        self.draw_label.setFont(QFont("Arial", 22, QFont.Bold))
+        self.draw_label.setStyleSheet("color: orange; background-color: black;")
+        self.draw_label.setAlignment(Qt.AlignCenter)
+        self.layout().addWidget(self.draw_label)
+
+    def ai_play_if_needed(self):
+        if self.vs_ai and self.state.current_player == 1 and not self.state.is_over:
+            QTimer.singleShot(700, lambda generation=self.ai_generation: self.ai_take_turn(generation))
+
+    def ai_take_turn(self, generation):
+        if generation != self.ai_generation or self.state.is_over or self.state.current_player != 1:
+            return
+        self.status_label.setText("🤔 AI is thinking…")
+        self.ai_worker = AIWorker(self.state.copy(), self.ai_difficulty, self.search_player, generation)
+        self.ai_worker.signals.progress.connect(self.show_ai_progress)
+        self.ai_worker.signals.finished.connect(self.apply_ai_move)
+        QThreadPool.globalInstance().start(self.ai_worker)
+
+    def show_ai_progress(self, generation, iterations, depth):
+        if generation == self.ai_generation:
+            self.status_label.setText(f"🤔 AI is thinking… {iterations} playouts, depth {depth}")
+
+    def apply_ai_move(self, generation, move):
+        if generation != self.ai_generation or self.state.is_over:
+            return
+        self.ai_worker = None
+        if move is None or not self.state.is_legal(move):
+            # The worker failed or answered for a stale position: fall back to a quick move
+            move = choose_move(self.state, "Easy")
+            if move is None:
+                return
+        self.status_label.setText("")
+        self.selected_card = move.card
+        self.play_move(move)
+
+    def cancel_ai(self):
+        # Any queued timer or in-flight worker from before this point is ignored
+        self.ai_generation += 1
+        if self.ai_worker is not None:
+            self.ai_worker.cancel()
+            self.ai_worker = None
+
+    def start_autosave(self):
+        # Rewrites the autosave with the current line of play; later moves are appended to it
+        self.stop_autosave()
+        try:
+            self.autosave_file = open(AUTOSAVE_PATH, 'wb')
+            self.autosave = RecordWriter(self.autosave_file, self.state)
+            if self.state.is_over:
+                self.autosave.finish()
+        except OSError:
+            self.stop_autosave()
+
+    def autosave_move(self, move):
+        if self.autosave is None:
+            return
+        try:
+            self.autosave.write_move(move)
+            if self.state.is_over:
+                self.autosave.finish()
+        except OSError:
+            self.stop_autosave()
+
+    def stop_autosave(self):
+        # An unfinished game is left without its end marker; read_record still loads it
+        if self.autosave_file is not None:
+            self.autosave_file.close()
+        self.autosave_file = None
+        self.autosave = None
+
+    def closeEvent(self, event):
+        self.cancel_ai()
+        QThreadPool.globalInstance().waitForDone(1000)
+        self.stop_autosave()
+        super().closeEvent(event)
+
+    def perform_removal(self, row, col):
+        self.play_move(Move(REMOVE, self.selected_card, row, col))
+
+    def has_valid_moves(self, player_index):
+        return self.state.has_valid_moves(player_index)
+
+
+class SettingsDialog(QDialog):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Sequence Game")
+        self.setFixedSize(350, 500)  # Compact size
+
+        self.stack = QStackedLayout()
+
+        self.setup_page = None
+        self.init_welcome_page()
+
+        container = QWidget()
+        container.setLayout(self.stack)
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(container)
+        self.setLayout(main_layout)
+
+    def init_welcome_page(self):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+
+        image = QLabel()
+        pixmap = QPixmap("sequencebanner.png")  
+        if not pixmap.isNull():
+            image.setPixmap(pixmap.scaledToWidth(300))
+            image.setPixmap(pixmap.scaled(image.width(), image.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            image.setPixmap(pixmap) 
+        else:
+            image.setText("Image not found.")
+        image.setAlignment(Qt.AlignCenter)
+        layout.addWidget(image)
+
+        # Play button
+        play_button = QPushButton("🎮 Play")
+        play_button.setFont(QFont("Arial", 12, QFont.Bold))
+        play_button.clicked.connect(self.show_setup_page)
+        layout.addWidget(play_button)
+
+        page.setLayout(layout)
+        self.stack.addWidget(page)
+
+    def show_setup_page(self):
+        # Built on demand so only the welcome page is created before the first paint
+        if self.setup_page is None:
+            self.init_setup_page()
+        self.stack.setCurrentWidget(self.setup_page)
+
+    def init_setup_page(self):
+        page = QWidget()
+        self.setup_page = page
+        layout = QVBoxLayout(page)
+
+        self.p1_name = QLineEdit()
+        self.p1_name.setPlaceholderText("Player 1 Name")
+        layout.addWidget(QLabel("Player 1 Name:"))
+        layout.addWidget(self.p1_name)
+
+        self.ai_checkbox = QCheckBox("Play vs AI?")
+        self.ai_checkbox.stateChanged.connect(self.toggle_ai_fields)
+        layout.addWidget(self.ai_checkbox)
+
+        self.p2_name = QLineEdit()
+        self.p2_name.setPlaceholderText("Player 2 Name")
+        layout.addWidget(QLabel("Player 2 Name:"))
+        layout.addWidget(self.p2_name)
+
+        self.difficulty = QComboBox()
+        self.difficulty.addItems(["Easy", "Medium", "Hard"])
+        layout.addWidget(QLabel("AI Difficulty:"))
+        layout.addWidget(self.difficulty)
+
+        self.think_time = QSpinBox()
+        self.think_time.setRange(100, 650)
+        self.think_time.setSingleStep(50)
+        self.think_time.setValue(500)
+        self.think_time.setSuffix(" ms")
+        self.difficulty.currentTextChanged.connect(self.toggle_ai_fields)
+        layout.addWidget(QLabel("Hard AI Think Time:"))
+        layout.addWidget(self.think_time)
+
+        start_button = QPushButton("🚀 Start Game")
+        start_button.clicked.connect(self.accept)
+        layout.addWidget(start_button)
+
+        page.setLayout(layout)
+        self.stack.addWidget(page)
+
+        self.toggle_ai_fields()  # Initial state
+
+    def toggle_ai_fields(self):
+        ai_enabled = self.ai_checkbox.isChecked()
+        self.p2_name.setEnabled(not ai_enabled)
+        self.difficulty.setEnabled(ai_enabled)
+        self.think_time.setEnabled(ai_enabled and self.difficulty.currentText() == "Hard")
+
+    def get_settings(self):
+        p1 = self.p1_name.text() or "Player 1"
+        p2 = "AI" if self.ai_checkbox.isChecked() else (self.p2_name.text() or "Player 2")
+        return {
+            'players': [p1, p2],
+            'vs_ai': self.ai_checkbox.isChecked(),
+            'ai_difficulty': self.difficulty.currentText(),
+            'ai_think_ms': self.think_time.value()
+        }
+
+
+class FirstPaintWatcher(QObject):
+    # Calls `callback` once, when `widget` receives its first paint event
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self.callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.callback is not None:
+            callback, self.callback = self.callback, None
+            obj.removeEventFilter(self)
+            callback()
+        return False
@@ -0,0 +1,235 @@
+import struct
+import sys
+
+from game_state import (
+    CARDS_PER_PLAYER, CELLS, CORNER_CELLS, DISCARD, JOKER, ONE_EYED_JACK, SIZE, TWO_EYED_JACK,
+    GameState, Move
+)
+
+# Binary game record, version 1 (all integers little-endian):
+#   b"SEQR", version byte, seed flag byte, seed (int64)
+#   100 board card codes, deck length byte, deck card codes (deck order before dealing)
+#   2 bytes per move: (kind << 6 | card code), cell (0xFE for a discard)
+#   b"\xff\xff" ends the game; several records may follow each other in one file
+MAGIC = b"SEQR"
+VERSION = 1
+END_OF_GAME = b"\xff\xff"
+DISCARD_CELL = 0xFE
+SEED_RANGE = range(-2 ** 63, 2 ** 63)
+
+# Fixed for the file format: never reorder, only append
+CARD_CODES = tuple(
+    f"{rank}{suit}"
+    for suit in ['♠', '♥', '♦', '♣']
+    for rank in ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Q', 'K', 'A']
+) + (ONE_EYED_JACK, TWO_EYED_JACK, JOKER)
+CARD_INDEX = {card: code for code, card in enumerate(CARD_CODES)}
+
+
+class RecordError(ValueError):
+    pass
+
+
+def encode_move(move):
+    cell = DISCARD_CELL if move.kind == DISCARD else move.row * SIZE + move.col
+    return bytes((move.kind << 6 | CARD_INDEX[move.card], cell))
+
+
+def decode_move(data):
+    kind, code = data[0] >> 6, data[0] & 0x3F
+    if kind == DISCARD:
+        valid_cell = data[1] == DISCARD_CELL
+    else:
+        valid_cell = data[1] < CELLS
+    if kind > DISCARD or code >= len(CARD_CODES) or not valid_cell:
+        raise RecordError(f"Corrupt move bytes {data.hex()}")
+    if kind == DISCARD:
+        return Move(DISCARD, CARD_CODES[code], -1, -1)
+    return Move(kind, CARD_CODES[code], *divmod(data[1], SIZE))
+
+
+def decode_cards(data):
+    if any(code >= len(CARD_CODES) for code in data):
+        raise RecordError("Corrupt card code")
+    return [CARD_CODES[code] for code in data]
+
+
+def encode_header(state):
+    return _encode_header(state.seed, state.cards, state.initial_deck)
+
+
+def _encode_header(seed, cards, deck):
+    if seed is not None and seed not in SEED_RANGE:
+        raise RecordError(f"Seed {seed} does not fit in a game record")
+    header = bytearray(MAGIC)
+    header.append(VERSION)
+    header.append(0 if seed is None else 1)
+    header += struct.pack("<q", 0 if seed is None else seed)
+    header += bytes(CARD_INDEX[card] for card in cards)
+    header.append(len(deck))
+    header += bytes(CARD_INDEX[card] for card in deck)
+    return bytes(header)
+
+
+def encode_game(state):
+    # A complete record of everything played on `state`, end marker included
+    return encode_header(state) + b"".join(encode_move(move) for move in state.moves) + END_OF_GAME
+
+
+def encode_record(record):
+    # Like encode_game, but with all of the record's moves, wherever a replay of it currently stands
+    cards = [card for row in record.board_layout for card in row]
+    return (_encode_header(record.seed, cards, record.deck)
+            + b"".join(encode_move(move) for move in record.moves) + END_OF_GAME)
+
+
+class RecordWriter:
+    # Streams one game: the header goes out immediately, then each move as it is played.
+    # Every write is flushed, so a crash loses at most the move being played. The caller
+    # owns the file and may stream further games into it after finish().
+    def __init__(self, file, state):
+        self.file = file
+        self.file.write(encode_header(state))
+        for move in state.moves:
+            self.file.write(encode_move(move))
+        self.file.flush()
+
+    def write_move(self, move):
+        self.file.write(encode_move(move))
+        self.file.flush()
+
+    def finish(self):
+        self.file.write(END_OF_GAME)
+        self.file.flush()
+
+
+class GameRecord:
+    def __init__(self, seed, board_layout, deck, moves):
+        self.seed = seed
+        self.board_layout = board_layout
+        self.deck = deck
+        self.moves = moves
+
+    def new_state(self):
+        return GameState(self.board_layout, self.deck, seed=self.seed)
+
+    def replay(self, turns=None):
+        # Headless replay up to `turns` moves (all by default)
+        state = self.new_state()
+        for move in self.moves[:turns]:
+            apply_recorded(state, move)
+        return state
+
+
+def record_of(state):
+    # Record of everything played on `state` so far
+    return GameRecord(state.seed, state.board_layout, list(state.initial_deck), state.moves)
+
+
+def apply_recorded(state, move):
+    # Records come from disk, so every move is checked before it touches the state
+    if not state.is_legal(move):
+        raise RecordError(f"Illegal move {len(state.history) + 1} in record: {move}")
+    state.apply(move)
+
+
+def _read_exact(file, size):
+    data = file.read(size)
+    if len(data) != size:
+        raise RecordError("Unexpected end of record")
+    return data
+
+
+def read_record(file):
+    # Next game in the stream, or None at end of file. A game cut off before
+    # its end marker (crash, game still running) is returned as far as it got.
+    magic = file.read(len(MAGIC))
+    if not magic:
+        return None
+    if magic != MAGIC:
+        raise RecordError("Not a Sequence game record")
+    version, has_seed = _read_exact(file, 2)
+    if version != VERSION:
+        raise RecordError(f"Unsupported record version {version}")
+    seed = struct.unpack("<q", _read_exact(file, 8))[0]
+    if not has_seed:
+        seed = None
+    cards = decode_cards(_read_exact(file, CELLS))
+    if any((card == JOKER) != (cell in CORNER_CELLS) for cell, card in enumerate(cards)):
+        raise RecordError("Corrupt board layout")
+    board_layout = [cards[row * SIZE:(row + 1) * SIZE] for row in range(SIZE)]
+    deck = decode_cards(_read_exact(file, _read_exact(file, 1)[0]))
+    if len(deck) < 2 * CARDS_PER_PLAYER or JOKER in deck:
+        raise RecordError("Corrupt deck")
+
+    moves = []
+    while True:
+        data = file.read(2)
+        if len(data) < 2 or data == END_OF_GAME:
+            break
+        moves.append(decode_move(data))
+    return GameRecord(seed, board_layout, deck, moves)
+
+
+def read_records(file):
+    while True:
+        record = read_record(file)
+        if record is None:
+            return
+        yield record
+
+
+def save_game(path, record):
+    with open(path, 'wb') as file:
+        file.write(encode_record(record))
+
+
+def load_game(path):
+    with open(path, 'rb') as file:
+        record = read_record(file)
+    if record is None:
+        raise RecordError("Empty game record")
+    return record
+
+
+class Replay:
+    """Seekable view of a record: moving to any turn applies or undoes only the moves in between."""
+
+    def __init__(self, record, state=None):
+        self.record = record
+        # `state` may be a game already played some way along the record
+        self.state = record.new_state() if state is None else state
+
+    @property
+    def turn(self):
+        return len(self.state.history)
+
+    def seek(self, turn):
+        turn = max(0, min(turn, len(self.record.moves)))
+        while self.turn > turn:
+            self.state.undo()
+        while self.turn < turn:
+            apply_recorded(self.state, self.record.moves[self.turn])
+        return self.state
+
+
+def main(argv=None):
+    # Replays every game in the given record files headlessly and prints a summary line each
+    paths = sys.argv[1:] if argv is None else argv
+    for path in paths:
+        with open(path, 'rb') as file:
+            for index, record in enumerate(read_records(file)):
+                try:
+                    state = record.replay()
+                except RecordError as error:
+                    print(f"{path}#{index}: {error}")
+                    continue
+                result = "draw" if state.winner is None else f"player {state.winner + 1} wins"
+                if not state.is_over:
+                    result = "unfinished"
+                print(f"{path}#{index}: seed {record.seed}, {len(record.moves)} moves, "
+                      f"sequences {state.scores[0]}-{state.scores[1]}, {result}")
+
+
+if __name__ == '__main__':
+    main()
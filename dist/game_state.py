@@ -0,0 +1,384 @@
+from collections import namedtuple
+import random
+
+import profiling
+
+# Chip codes stored in GameState.board (one byte per cell, row-major)
+EMPTY = 0
+BLUE = 1
+GREEN = 2
+LOCKED = 3   # part of a completed sequence (🔴), counts for both players
+CORNER = 4   # free corner (Joker), counts for both players
+
+PLAYER_CHIPS = (BLUE, GREEN)
+
+ONE_EYED_JACK = "1-Eyed Jack"
+TWO_EYED_JACK = "2-Eyed Jack"
+JOKER = "Joker"
+
+# Move kinds
+PLACE = 0
+REMOVE = 1
+DISCARD = 2   # dead card: swapped for a new one, the turn continues
+
+SIZE = 10
+CELLS = SIZE * SIZE
+CORNER_POSITIONS = {(0, 0), (0, 9), (9, 0), (9, 9)}
+CORNER_CELLS = tuple(r * SIZE + c for r, c in sorted(CORNER_POSITIONS))
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+SEQUENCES_TO_WIN = 2
+CARDS_PER_PLAYER = 7
+
+Move = namedtuple('Move', ['kind', 'card', 'row', 'col'])
+
+SUITS = ('♠', '♥', '♦', '♣')
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+
+# Built once and shuffled by copy. Two full decks; one-eyed Jacks are ♠/♥, two-eyed ♦/♣.
+DECK_CARDS = tuple(
+    (ONE_EYED_JACK if suit in ('♠', '♥') else TWO_EYED_JACK) if rank == 'J' else f"{rank}{suit}"
+    for _ in range(2) for suit in SUITS for rank in RANKS
+)
+# The board holds both decks minus the Jacks, plus the four Joker corners
+BOARD_CARDS = tuple(f"{rank}{suit}" for _ in range(2) for suit in SUITS for rank in RANKS if rank != 'J')
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def popcount(bits):
+        return bin(bits).count('1')
+
+
+def _build_lines():
+    # Every 5-cell line on the board as a 100-bit mask, plus the masks through each cell
+    lines = []
+    through = [[] for _ in range(CELLS)]
+    for dr, dc in DIRECTIONS:
+        for r in range(SIZE):
+            for c in range(SIZE):
+                end_r, end_c = r + 4 * dr, c + 4 * dc
+                if not (0 <= end_r < SIZE and 0 <= end_c < SIZE):
+                    continue
+                cells = tuple((r + i * dr) * SIZE + c + i * dc for i in range(5))
+                mask = 0
+                for cell in cells:
+                    mask |= 1 << cell
+                lines.append(mask)
+                for cell in cells:
+                    through[cell].append(mask)
+    # Per cell, lines stay ordered by direction and then by their lowest cell
+    return tuple(lines), tuple(tuple(masks) for masks in through)
+
+
+LINES, LINES_THROUGH = _build_lines()
+CORNER_MASK = sum(1 << cell for cell in CORNER_CELLS)
+OPEN_MASK = ((1 << CELLS) - 1) & ~CORNER_MASK
+
+
+def cells_of(mask):
+    cells = []
+    while mask:
+        low = mask & -mask
+        cells.append(low.bit_length() - 1)
+        mask ^= low
+    return cells
+
+
+def new_deck(rng=random):
+    deck = list(DECK_CARDS)
+    rng.shuffle(deck)
+    return deck
+
+
+def generate_random_board(rng=random):
+    cards = list(BOARD_CARDS)
+    rng.shuffle(cards)
+    cards = iter(cards)
+    return [[JOKER if (r, c) in CORNER_POSITIONS else next(cards) for c in range(SIZE)]
+            for r in range(SIZE)]
+
+
+# Zobrist keys: board cells, hand cards (per copy held), scores and side to move
+_zobrist_rng = random.Random(20240601)
+ZOBRIST_CELLS = [[_zobrist_rng.getrandbits(64) for _ in range(5)] for _ in range(CELLS)]
+ZOBRIST_CARDS = {card: [_zobrist_rng.getrandbits(64) for _ in range(4)]
+                 for card in sorted(set(DECK_CARDS))}
+ZOBRIST_SCORES = [[_zobrist_rng.getrandbits(64) for _ in range(SEQUENCES_TO_WIN + 1)] for _ in PLAYER_CHIPS]
+ZOBRIST_TURN = _zobrist_rng.getrandbits(64)
+_INITIAL_HASH = 0
+for _cell in range(CELLS):
+    _INITIAL_HASH ^= ZOBRIST_CELLS[_cell][CORNER if _cell in CORNER_CELLS else EMPTY]
+
+
+def new_game(seed=None):
+    if seed is None:
+        # Always pick a concrete seed so the game can be recorded and reproduced
+        seed = random.randrange(2 ** 63)
+    rng = random.Random(seed)
+    board_layout = generate_random_board(rng)
+    return GameState(board_layout, new_deck(rng), seed=seed)
+
+
+def build_position_index(cards):
+    # card -> board cells; every non-Jack card sits on exactly two cells
+    index = {}
+    for cell, card in enumerate(cards):
+        if card != JOKER:
+            index.setdefault(card, []).append(cell)
+    return {card: tuple(cells) for card, cells in index.items()}
+
+
+def opponent_chip(player):
+    return PLAYER_CHIPS[1 - player]
+
+
+class GameState:
+    """Headless Sequence rules: board, hands, deck and scores without any Qt widgets."""
+
+    def __init__(self, board_layout, deck, num_players=2, seed=None):
+        self.seed = seed
+        self.board_layout = [list(row) for row in board_layout]
+        self.cards = tuple(card for row in self.board_layout for card in row)
+        self.positions = build_position_index(self.cards)
+        self.board = bytearray(CELLS)
+        for cell in CORNER_CELLS:
+            self.board[cell] = CORNER
+        # Kept in step with self.board by _set_cell so move generation never scans the grid
+        self.open_cells = set(range(CELLS)) - set(CORNER_CELLS)
+        self.chip_cells = {chip: set() for chip in PLAYER_CHIPS}
+        # One 100-bit board per chip code; bits[LOCKED] is the locked-sequence mask
+        self.bits = [OPEN_MASK, 0, 0, 0, CORNER_MASK]
+        self.board_hash = _INITIAL_HASH
+        self.initial_deck = tuple(deck)
+        self.deck = list(deck)
+        self.hands = [[self.deck.pop() for _ in range(CARDS_PER_PLAYER)] for _ in range(num_players)]
+        self.scores = [0] * num_players
+        self.current_player = 0
+        self.winner = None
+        self.drawn = False
+        self.history = []
+
+    def copy(self):
+        other = GameState.__new__(GameState)
+        other.seed = self.seed
+        other.initial_deck = self.initial_deck
+        other.board_layout = self.board_layout
+        other.cards = self.cards
+        other.positions = self.positions
+        other.board = bytearray(self.board)
+        other.open_cells = set(self.open_cells)
+        other.chip_cells = {chip: set(cells) for chip, cells in self.chip_cells.items()}
+        other.bits = list(self.bits)
+        other.board_hash = self.board_hash
+        other.deck = list(self.deck)
+        other.hands = [list(hand) for hand in self.hands]
+        other.scores = list(self.scores)
+        other.current_player = self.current_player
+        other.winner = self.winner
+        other.drawn = self.drawn
+        other.history = []
+        return other
+
+    @property
+    def moves(self):
+        # Every move applied so far, oldest first
+        return [entry[0] for entry in self.history]
+
+    @property
+    def is_over(self):
+        return self.winner is not None or self.drawn
+
+    def chip_at(self, row, col):
+        return self.board[row * SIZE + col]
+
+    def _set_cell(self, cell, value):
+        old = self.board[cell]
+        if old == value:
+            return
+        if old == EMPTY:
+            self.open_cells.discard(cell)
+        elif old in self.chip_cells:
+            self.chip_cells[old].discard(cell)
+        if value == EMPTY:
+            self.open_cells.add(cell)
+        elif value in self.chip_cells:
+            self.chip_cells[value].add(cell)
+        bit = 1 << cell
+        self.bits[old] &= ~bit
+        self.bits[value] |= bit
+        cell_keys = ZOBRIST_CELLS[cell]
+        self.board_hash ^= cell_keys[old] ^ cell_keys[value]
+        self.board[cell] = value
+
+    def zobrist_key(self, player):
+        # Position as seen by `player`: board, their own hand, scores and side to move
+        key = self.board_hash
+        seen = {}
+        for card in self.hands[player]:
+            copy = seen.get(card, 0)
+            seen[card] = copy + 1
+            key ^= ZOBRIST_CARDS[card][copy]
+        for index, score in enumerate(self.scores):
+            key ^= ZOBRIST_SCORES[index][min(score, SEQUENCES_TO_WIN)]
+        if self.current_player:
+            key ^= ZOBRIST_TURN
+        return key
+
+    def removable_positions(self, player=None):
+        if player is None:
+            player = self.current_player
+        return [divmod(cell, SIZE) for cell in sorted(self.chip_cells[opponent_chip(player)])]
+
+    def is_dead_card(self, card):
+        cells = self.positions.get(card)
+        return cells is not None and all(self.board[cell] != EMPTY for cell in cells)
+
+    def moves_for_card(self, card, player=None):
+        if player is None:
+            player = self.current_player
+        if card == ONE_EYED_JACK:
+            return [Move(REMOVE, card, r, c) for r, c in self.removable_positions(player)]
+        if card == TWO_EYED_JACK:
+            if profiling.ENABLED:
+                profiling.count('cells_scanned', len(self.open_cells))
+            return [Move(PLACE, card, *divmod(cell, SIZE)) for cell in sorted(self.open_cells)]
+        cells = self.positions.get(card, ())
+        if profiling.ENABLED:
+            profiling.count('cells_scanned', len(cells))
+        return [Move(PLACE, card, *divmod(cell, SIZE)) for cell in cells if self.board[cell] == EMPTY]
+
+    @profiling.phase('legal_moves')
+    def legal_moves(self):
+        if self.is_over:
+            return []
+        hand = self.hands[self.current_player]
+        moves = []
+        dead = []
+        for card in dict.fromkeys(hand):
+            card_moves = self.moves_for_card(card)
+            if card_moves:
+                moves.extend(card_moves)
+            elif card not in (ONE_EYED_JACK, TWO_EYED_JACK):
+                dead.append(Move(DISCARD, card, -1, -1))
+        moves.extend(dead)
+        if not moves:
+            # Nothing playable (e.g. only 1-Eyed Jacks on an empty board): swap a card
+            moves = [Move(DISCARD, card, -1, -1) for card in dict.fromkeys(hand)]
+        return moves
+
+    def is_legal(self, move):
+        if self.is_over or move.card not in self.hands[self.current_player]:
+            return False
+        if move.kind == DISCARD:
+            return move in self.legal_moves()
+        cell = move.row * SIZE + move.col
+        if move.kind == REMOVE:
+            return move.card == ONE_EYED_JACK and self.board[cell] == opponent_chip(self.current_player)
+        if self.board[cell] != EMPTY:
+            return False
+        return move.card == TWO_EYED_JACK or move.card == self.cards[cell]
+
+    @profiling.phase('has_valid_moves')
+    def has_valid_moves(self, player):
+        for card in self.hands[player]:
+            if card == TWO_EYED_JACK:
+                if self.open_cells:
+                    return True
+            elif card == ONE_EYED_JACK:
+                if self.chip_cells[opponent_chip(player)]:
+                    return True
+            elif not self.is_dead_card(card):
+                return True
+        return False
+
+    def owned_mask(self, chip):
+        # Cells that count towards a sequence for `chip`
+        return self.bits[chip] | self.bits[LOCKED] | CORNER_MASK
+
+    @profiling.phase('find_sequence')
+    def find_sequence(self, row, col, chip):
+        cell = row * SIZE + col
+        owned = self.owned_mask(chip)
+        locked = self.bits[LOCKED]
+        for mask in LINES_THROUGH[cell]:
+            # A new sequence may share at most one chip with an earlier one
+            if mask & owned == mask and popcount(mask & locked) <= 1:
+                return cells_of(mask)
+        return None
+
+    def possible_sequence(self, row, col, chip):
+        # Would a chip here leave an unblocked line one chip short? (AI looks one move ahead)
+        cell = row * SIZE + col
+        owned = self.owned_mask(chip) | (1 << cell)
+        blocked = self.bits[BLUE + GREEN - chip]
+        locked = self.bits[LOCKED]
+        for mask in LINES_THROUGH[cell]:
+            if not mask & blocked and popcount(mask & owned) >= 4 and popcount(mask & locked) <= 1:
+                return True
+        return False
+
+    def count_threats(self, chip, missing=1):
+        # Open lines `chip` could complete with exactly `missing` more chips
+        owned = self.owned_mask(chip)
+        blocked = self.bits[BLUE + GREEN - chip]
+        locked = self.bits[LOCKED]
+        count = 0
+        for mask in LINES:
+            if (not mask & blocked and popcount(mask & ~owned) == missing
+                    and popcount(mask & locked) <= 1):
+                count += 1
+        return count
+
+    @profiling.phase('apply')
+    def apply(self, move):
+        player = self.current_player
+        hand = self.hands[player]
+        slot = hand.index(move.card)
+        hand.pop(slot)
+        changed = []
+        score, winner, drawn = self.scores[player], self.winner, self.drawn
+
+        if move.kind != DISCARD:
+            cell = move.row * SIZE + move.col
+            changed.append((cell, self.board[cell]))
+            if move.kind == PLACE:
+                chip = PLAYER_CHIPS[player]
+                self._set_cell(cell, chip)
+                five = self.find_sequence(move.row, move.col, chip)
+                if five:
+                    for p in five:
+                        if self.board[p] != CORNER:
+                            changed.append((p, self.board[p]))
+                            self._set_cell(p, LOCKED)
+                    self.scores[player] += 1
+                    if self.scores[player] >= SEQUENCES_TO_WIN:
+                        self.winner = player
+            else:
+                self._set_cell(cell, EMPTY)
+
+        drew = bool(self.deck)
+        if drew:
+            hand.append(self.deck.pop())
+        elif self.winner is None:
+            self.drawn = True
+        if move.kind != DISCARD:
+            self.current_player = 1 - player
+        if profiling.ENABLED:
+            profiling.count('turns' if move.kind != DISCARD else 'discards')
+        self.history.append((move, player, slot, changed, score, winner, drawn, drew))
+
+    def undo(self, move=None):
+        last, player, slot, changed, score, winner, drawn, drew = self.history.pop()
+        if move is not None and move != last:
+            raise ValueError(f"Cannot undo {move}: last move was {last}")
+        hand = self.hands[player]
+        if drew:
+            self.deck.append(hand.pop())
+        hand.insert(slot, last.card)
+        for cell, value in reversed(changed):
+            self._set_cell(cell, value)
+        self.scores[player] = score
+        self.winner = winner
+        self.drawn = drawn
+        self.current_player = player
+        return last
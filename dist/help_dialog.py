@@ -0,0 +1,117 @@
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QTextEdit
+from PySide6.QtGui import QFont
+
+
+class HelpDialog(QDialog):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("📖 How to Play - Sequence Game")
+        self.setFixedSize(500, 600)
+
+        layout = QVBoxLayout()
+
+        guide = """
+🎯 WELCOME TO SEQUENCE - THE STRATEGIC CARD & CHIPS GAME! 🎯
+
+🧩 OBJECTIVE:
+Your mission is to form 2 separate sequences(each with 5 chips in a row) before your opponent does.
+
+Each sequence can be made horizontally, vertically, or diagonally. Think like a mix of cards + tic-tac-toe + chess!
+
+
+🎮 HOW TO PLAY - YOUR TURN:
+1️⃣ Choose a card from your hand (you get 7 at the start).
+2️⃣ Find a matching card on the board and place your chip there.
+3️⃣ The spot gets locked and cannot be used again.
+
+💡 Don’t worry — each card appears twice on the board!
+💀 Dead card? If both of its spaces are taken it is crossed out — click it to swap it for a new card, then play your turn.
+
+🎴 SPECIAL JACK CARDS:
+🃏 Two-Eyed Jack → Wildcard! Place your chip on ANY open space.
+🃏 One-Eyed Jack → Sneaky! Remove an opponent’s chip from the board.
+
+✨ Pro Tip: Use these wisely to build your sequences or block your rival!
+
+
+🏆 HOW TO WIN:
+✅ First player to complete two 5-chip sequences wins the game.
+🤝 If no valid moves remain for both players, it's a draw.
+
+
+🃏 ABOUT THE BOARD:
+- Corners (marked as “Joker”) are wild — they count for both players.
+- Each card on the board is from a double deck (excluding Jacks).
+
+🟦 Player 1 uses: 🔵 Blue chips  
+🟩 Player 2 / AI uses: 🟢 Green chips  
+🔴 Red chips represent completed sequences  
+🎴 AI cards are hidden
+
+
+🧠 AI DIFFICULTY LEVELS:
+• Easy: Makes random moves — perfect for beginners.
+• Medium: Picks better options, still casual.
+• Hard: Thinks ahead, makes smart plays, tries to block & win.
+
+
+💡 STRATEGY TIPS:
+
+🎯 1. Control the Center:
+• Owning center spaces gives you the most flexibility to build sequences in any direction.
+• It also helps block your opponent's potential sequences.
+
+🧠 2. Think Ahead:
+• Don’t just play your card — plan your next 2–3 moves in advance.
+• Always ask: “Does this move help me or help block my opponent?”
+
+🚫 3. Block Aggressively:
+• Notice your opponent forming a line of 2 or 3 chips?
+Use a One-Eyed Jack to remove their chip or place yours to interrupt their pattern.
+
+🃏 4. Use Jacks Wisely:
+• Two-Eyed Jack can be your winning move — save it for the perfect moment.
+• One-Eyed Jack is best used when your opponent is close to completing a sequence.
+
+🔁 5. Use Duplicates to Your Advantage:
+• Each board card exists twice. If one is taken, try for the other!
+• Also, try placing where both copies** of a card are still available to maximize flexibility.
+
+👀 6. Watch for Overlaps:
+• You can share chips between two sequences.
+• A great move is one that contributes to two different lines at once.
+
+🧱 7. Don't Waste Good Cards:
+• Just because you can play a card doesn’t mean you should. 
+• Sometimes it’s smarter to wait and block instead.
+
+🎴 8. Adapt to the AI:
+• Easy AI makes random plays — go aggressive.
+• Medium AI blocks sometimes — play balanced.
+• Hard AI is smart — mix offense with defense, and use Jacks tactically.
+
+👫 9. Learn Your Opponent:
+• Human players may follow patterns. If they always go for the corners first, stop them.
+• Watch what cards they don’t play — they may be saving a Jack!
+
+🏁 10. Finish Strong:
+• Don’t get distracted by small plays near the end.
+• Focus on completing sequences quickly once you're close.
+
+🧩 Bonus Tip:
+• Practice! The more you play, the better you’ll recognize patterns and trap opportunities.
+
+
+🚀 GOOD LUCK, HAVE FUN, AND PLAY SMART!
+"""
+        text = QTextEdit()
+        text.setReadOnly(True)
+        text.setPlainText(guide)
+        text.setFont(QFont("Arial", 11))
+        layout.addWidget(text)
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+
+        self.setLayout(layout)
@@ -0,0 +1,82 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+# Opt-in: SEQUENCE_PROFILE=1 prints a report on exit, SEQUENCE_PROFILE=<file>.json writes one
+SETTING = os.environ.get("SEQUENCE_PROFILE", "")
+ENABLED = SETTING not in ("", "0")
+
+counters = Counter()
+seconds = Counter()
+calls = Counter()
+
+
+def count(name, amount=1):
+    counters[name] += amount
+
+
+def phase(name):
+    # Times every call of the decorated function; returns it untouched when profiling is off
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds[name] += time.perf_counter() - start
+                calls[name] += 1
+        return timed
+    return decorate
+
+
+def report():
+    return {
+        'counters': dict(counters),
+        'phases': {
+            name: {'calls': calls[name], 'seconds': round(seconds[name], 6),
+                   'avg_us': round(seconds[name] / calls[name] * 1e6, 2)}
+            for name in sorted(calls)
+        },
+    }
+
+
+def dump():
+    data = report()
+    if SETTING.lower().endswith('.json'):
+        with open(SETTING, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+        return
+    print("Sequence profile:", file=sys.stderr)
+    for name, value in sorted(data['counters'].items()):
+        print(f"  {name:<24} {value}", file=sys.stderr)
+    for name, stats in data['phases'].items():
+        print(f"  {name:<24} {stats['calls']:>9} calls {stats['seconds']:>10.4f} s "
+              f"{stats['avg_us']:>10.2f} us/call", file=sys.stderr)
+
+
+def snapshot():
+    # Raw totals, so worker processes can hand theirs back to the parent
+    return dict(counters), dict(seconds), dict(calls)
+
+
+def merge(totals):
+    for target, values in zip((counters, seconds, calls), totals):
+        target.update(values)
+
+
+def reset():
+    counters.clear()
+    seconds.clear()
+    calls.clear()
+
+
+if ENABLED:
+    atexit.register(dump)
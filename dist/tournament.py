@@ -0,0 +1,189 @@
+import argparse
+import csv
+import json
+import math
+import multiprocessing
+import random
+import sys
+import time
+
+import profiling
+from ai_player import MCTSPlayer, choose_move
+from game_record import SEED_RANGE, encode_game
+from game_state import DISCARD, new_game
+
+# "Greedy" is the old one-ply Hard heuristic; "Hard" is the search player the GUI uses
+STRATEGIES = ["Easy", "Medium", "Greedy", "Hard"]
+RESULT_FIELDS = [
+    'game', 'seed', 'blue', 'green', 'winner', 'winner_strategy', 'turns', 'discards',
+    'blue_sequences', 'green_sequences', 'empty_deck_draw', 'seconds', 'moves_per_sec'
+]
+DEFAULT_ITERATIONS = 400   # roughly 200 ms per move on a typical desktop core
+
+
+def make_player(strategy, rng, think_ms, iterations):
+    if strategy == "Hard":
+        if think_ms is None:
+            # Fixed playout count: the same seed gives the same game on any machine and load
+            player = MCTSPlayer(time_budget=None, max_iterations=iterations, rng=rng)
+        else:
+            player = MCTSPlayer(time_budget=think_ms / 1000, rng=rng)
+        return player.choose_move
+    difficulty = "Hard" if strategy == "Greedy" else strategy
+    return lambda state: choose_move(state, difficulty, rng)
+
+
+def play_game(job):
+    game, seed, seats, think_ms, iterations, keep_record = job
+    profiling.reset()
+    state = new_game(seed)
+    players = [make_player(strategy, random.Random(f"{seed}/{seat}"), think_ms, iterations)
+               for seat, strategy in enumerate(seats)]
+    turns = 0
+    discards = 0
+    start = time.perf_counter()
+    while not state.is_over:
+        move = players[state.current_player](state)
+        state.apply(move)
+        # A dead-card swap keeps the turn, so it is counted on its own
+        if move.kind == DISCARD:
+            discards += 1
+        else:
+            turns += 1
+    seconds = time.perf_counter() - start
+    result = {
+        'game': game,
+        'seed': seed,
+        'blue': seats[0],
+        'green': seats[1],
+        'winner': state.winner,
+        'winner_strategy': seats[state.winner] if state.winner is not None else None,
+        'turns': turns,
+        'discards': discards,
+        'blue_sequences': state.scores[0],
+        'green_sequences': state.scores[1],
+        'empty_deck_draw': state.drawn,
+        'seconds': round(seconds, 4),
+        'moves_per_sec': round((turns + discards) / seconds, 1) if seconds else None,
+    }
+    if profiling.ENABLED:
+        result['profile'] = profiling.snapshot()
+    if keep_record:
+        result['record'] = encode_game(state)
+    return result
+
+
+def wilson_interval(wins, games, z=1.96):
+    if not games:
+        return 0.0, 0.0
+    rate = wins / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class ResultWriter:
+    # Streams one row per finished game as JSONL, or CSV when the path ends in .csv
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.csv = None
+        if path.lower().endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            self.csv.writeheader()
+
+    def write(self, result):
+        if self.csv is not None:
+            self.csv.writerow(result)
+        else:
+            self.file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def summarize(results, out=sys.stdout):
+    games = len(results)
+    print(f"\nGames: {games}", file=out)
+    if not games:
+        return
+    draws = sum(1 for result in results if result['winner'] is None)
+    turns = sum(result['turns'] for result in results)
+    discards = sum(result['discards'] for result in results)
+    seconds = sum(result['seconds'] for result in results)
+    moves = turns + discards
+    print(f"Draws (empty deck): {draws}", file=out)
+    print(f"Average turns: {turns / games:.1f}, dead-card discards: {discards / games:.2f}, "
+          f"{moves / seconds if seconds else 0:.0f} moves/sec", file=out)
+    for seat, colour in enumerate(['blue', 'green']):
+        strategies = sorted({result[colour] for result in results})
+        wins = sum(1 for result in results if result['winner'] == seat)
+        low, high = wilson_interval(wins, games)
+        print(f"{colour.capitalize()} ({'/'.join(strategies)}): {wins} wins, "
+              f"{wins / games:.1%} [95% CI {low:.1%} - {high:.1%}]", file=out)
+    if any(result['blue'] != result['green'] for result in results):
+        for strategy in sorted({result['blue'] for result in results} | {result['green'] for result in results}):
+            played = sum(1 for result in results if strategy in (result['blue'], result['green']))
+            wins = sum(1 for result in results if result['winner_strategy'] == strategy)
+            low, high = wilson_interval(wins, played)
+            print(f"{strategy}: {wins}/{played} wins, {wins / played:.1%} "
+                  f"[95% CI {low:.1%} - {high:.1%}]", file=out)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless AI-vs-AI Sequence games in parallel.")
+    parser.add_argument('-n', '--games', type=int, default=100, help="number of games to play")
+    parser.add_argument('--blue', choices=STRATEGIES, default="Medium", help="strategy for the first seat")
+    parser.add_argument('--green', choices=STRATEGIES, default="Medium", help="strategy for the second seat")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game; game i uses seed + i")
+    parser.add_argument('--swap-seats', action='store_true', help="alternate which strategy moves first")
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help=f"playouts per move for Hard (default {DEFAULT_ITERATIONS}); reproducible")
+    budget.add_argument('--think-ms', type=int,
+                        help="search Hard by wall-clock time instead; results then depend on machine load")
+    parser.add_argument('-j', '--workers', type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes (default: all CPU cores)")
+    parser.add_argument('-o', '--output', help="write per-game results to a .jsonl or .csv file")
+    parser.add_argument('--record', help="archive every game as a binary game record (.seqr)")
+    args = parser.parse_args(argv)
+    if args.record and not (args.seed in SEED_RANGE and args.seed + args.games - 1 in SEED_RANGE):
+        parser.error("--record needs seeds that fit in a signed 64-bit integer")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = []
+    for game in range(args.games):
+        seats = (args.blue, args.green)
+        if args.swap_seats and game % 2:
+            seats = seats[::-1]
+        jobs.append((game, args.seed + game, seats, args.think_ms, args.iterations, bool(args.record)))
+
+    writer = ResultWriter(args.output) if args.output else None
+    archive = open(args.record, 'wb') if args.record else None
+    results = []
+    try:
+        with multiprocessing.Pool(max(1, args.workers)) as pool:
+            for result in pool.imap_unordered(play_game, jobs):
+                profile = result.pop('profile', None)
+                if profile is not None:
+                    profiling.merge(profile)
+                record = result.pop('record', None)
+                if archive is not None:
+                    archive.write(record)
+                results.append(result)
+                if writer is not None:
+                    writer.write(result)
+    finally:
+        if writer is not None:
+            writer.close()
+        if archive is not None:
+            archive.close()
+    summarize(results)
+
+
+if __name__ == '__main__':
+    main()
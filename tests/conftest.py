@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The game modules live in dist/ next to the launcher and are imported as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dist"))
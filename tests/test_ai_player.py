@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from ai_player import MCTSPlayer
+from game_state import new_game
+
+
+def test_iteration_only_search_is_legal_and_repeatable():
+    state = new_game(1)
+    moves = [MCTSPlayer(time_budget=None, max_iterations=20, rng=random.Random(7)).choose_move(state)
+             for _ in range(2)]
+    assert state.is_legal(moves[0])
+    assert moves[0] == moves[1]
+    assert not state.history
+
+
+def test_search_needs_a_budget():
+    with pytest.raises(ValueError):
+        MCTSPlayer(time_budget=None)
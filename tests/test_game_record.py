@@ -0,0 +1,124 @@
+import io
+import random
+
+import pytest
+
+from ai_player import choose_move
+from game_record import (
+    CARD_INDEX, RecordError, RecordWriter, Replay, encode_game, encode_header, encode_move, load_game, read_record,
+    read_records, record_of, save_game
+)
+from game_state import PLACE, Move, new_game
+
+BOARD_OFFSET = 14          # magic, version, seed flag, seed
+DECK_OFFSET = BOARD_OFFSET + 100
+
+
+def play(seed, plies=None):
+    state = new_game(seed)
+    rng = random.Random(seed)
+    while not state.is_over and (plies is None or len(state.history) < plies):
+        state.apply(choose_move(state, "Medium", rng))
+    return state
+
+
+def test_record_round_trip():
+    state = play(5)
+    record = read_record(io.BytesIO(encode_game(state)))
+    assert record.seed == state.seed
+    assert record.board_layout == state.board_layout
+    assert tuple(record.deck) == state.initial_deck
+    assert record.moves == state.moves
+
+    replayed = record.replay()
+    assert bytes(replayed.board) == bytes(state.board)
+    assert replayed.hands == state.hands
+    assert replayed.scores == state.scores
+    assert replayed.winner == state.winner
+
+
+def test_several_records_in_one_stream():
+    states = [play(seed, plies=30) for seed in range(3)]
+    stream = io.BytesIO(b"".join(encode_game(state) for state in states))
+    assert [record.moves for record in read_records(stream)] == [state.moves for state in states]
+
+
+def test_streamed_records_round_trip():
+    stream = io.BytesIO()
+    games = []
+    for seed in range(3):
+        state = new_game(seed)
+        rng = random.Random(seed)
+        writer = RecordWriter(stream, state)
+        while not state.is_over and (seed < 2 or len(state.history) < 25):
+            move = choose_move(state, "Medium", rng)
+            state.apply(move)
+            writer.write_move(move)
+        if seed < 2:
+            writer.finish()   # the last game is left unfinished, as after a crash
+        games.append(state.moves)
+    stream.seek(0)
+    assert [record.moves for record in read_records(stream)] == games
+
+
+def test_save_after_seeking_back_keeps_every_move(tmp_path):
+    state = play(6)
+    winner = state.winner
+    replay = Replay(record_of(state), state)
+    replay.seek(10)
+    path = tmp_path / "game.seqr"
+    save_game(path, replay.record)
+
+    record = load_game(path)
+    assert len(record.moves) > 10
+    assert record.moves == replay.record.moves
+    assert Replay(record).seek(len(record.moves)).winner == winner
+
+
+def test_negative_seed_round_trip():
+    state = play(-5, plies=10)
+    assert read_record(io.BytesIO(encode_game(state))).seed == -5
+
+
+def test_seed_outside_int64_is_rejected():
+    state = new_game(2 ** 63)
+    with pytest.raises(RecordError):
+        encode_header(state)
+
+
+def corrupt(data, offset, value):
+    data = bytearray(data)
+    data[offset] = value
+    return io.BytesIO(bytes(data))
+
+
+@pytest.mark.parametrize('offset', [BOARD_OFFSET + 1, DECK_OFFSET + 1])
+def test_bad_card_code_is_a_record_error(offset):
+    data = encode_game(play(4, plies=10))
+    with pytest.raises(RecordError):
+        read_record(corrupt(data, offset, 0xF0))
+
+
+def test_short_deck_is_a_record_error():
+    state = play(4, plies=0)
+    deck = bytes(CARD_INDEX[card] for card in state.initial_deck[:13])
+    data = encode_header(state)[:DECK_OFFSET] + bytes([len(deck)]) + deck
+    with pytest.raises(RecordError):
+        read_record(io.BytesIO(data))
+
+
+def test_illegal_move_is_a_record_error():
+    state = new_game(4)
+    occupied = Move(PLACE, state.hands[0][0], 0, 0)   # corner cells never take a chip
+    record = read_record(io.BytesIO(encode_header(state) + encode_move(occupied)))
+    with pytest.raises(RecordError):
+        record.replay()
+    with pytest.raises(RecordError):
+        Replay(record).seek(1)
+
+
+def test_unknown_move_kind_is_a_record_error():
+    state = new_game(4)
+    move = bytes((3 << 6 | CARD_INDEX[state.hands[0][0]], 0))
+    with pytest.raises(RecordError):
+        read_record(io.BytesIO(encode_header(state) + move))
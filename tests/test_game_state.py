@@ -0,0 +1,130 @@
+import random
+
+from ai_player import choose_move
+from game_state import (
+    BLUE, CELLS, CORNER, DISCARD, EMPTY, GREEN, LOCKED, PLACE, TWO_EYED_JACK,
+    Move, PLAYER_CHIPS, new_game
+)
+
+
+def snapshot(state):
+    return (bytes(state.board), list(state.bits), set(state.open_cells),
+            {chip: set(cells) for chip, cells in state.chip_cells.items()}, state.board_hash,
+            [list(hand) for hand in state.hands], list(state.deck), list(state.scores),
+            state.current_player, state.winner, state.drawn)
+
+
+# Scattered cells for the other player's turns; no five of them ever line up
+FILLER = [(5, 0), (7, 1), (5, 3), (7, 4), (5, 6), (7, 7), (9, 2), (9, 5)]
+
+
+def place(state, row, col):
+    # Plays a Two-Eyed Jack for whoever is to move, so tests can put chips anywhere
+    state.hands[state.current_player][0] = TWO_EYED_JACK
+    state.apply(Move(PLACE, TWO_EYED_JACK, row, col))
+
+
+def test_apply_undo_round_trip():
+    for seed in range(20):
+        state = new_game(seed)
+        rng = random.Random(seed)
+        while not state.is_over:
+            move = choose_move(state, "Medium", rng)
+            before = snapshot(state)
+            state.apply(move)
+            after = snapshot(state)
+            assert state.undo(move) == move
+            assert snapshot(state) == before
+            state.apply(move)
+            assert snapshot(state) == after
+
+
+def test_incremental_sets_match_board():
+    state = new_game(3)
+    rng = random.Random(3)
+    while not state.is_over:
+        state.apply(choose_move(state, "Medium", rng))
+        assert state.open_cells == {cell for cell in range(CELLS) if state.board[cell] == EMPTY}
+        for chip in PLAYER_CHIPS:
+            assert state.chip_cells[chip] == {cell for cell in range(CELLS) if state.board[cell] == chip}
+        for code in range(5):
+            assert state.bits[code] == sum(1 << cell for cell in range(CELLS) if state.board[cell] == code)
+
+
+def test_corner_counts_towards_sequence():
+    state = new_game(1)
+    for col in range(1, 5):
+        place(state, 0, col)
+        if col < 4:
+            place(state, *FILLER[col])
+    assert state.scores == [1, 0]
+    assert state.chip_at(0, 0) == CORNER
+    assert all(state.chip_at(0, col) == LOCKED for col in range(1, 5))
+
+
+def test_sequences_share_at_most_one_chip():
+    state = new_game(1)
+    filler = iter(FILLER)
+    for col in range(5):
+        place(state, 1, col)
+        place(state, *next(filler))
+    assert state.scores == [1, 0]
+
+    # Columns 3-7 would reuse two locked chips, so this is not a second sequence yet
+    for col in range(5, 8):
+        place(state, 1, col)
+        place(state, *next(filler))
+    assert state.scores == [1, 0]
+    assert state.chip_at(1, 5) == BLUE
+
+    # Columns 4-8 share only (1, 4) with the first sequence
+    place(state, 1, 8)
+    assert state.scores == [2, 0]
+    assert state.winner == 0
+    assert state.is_over
+
+
+def test_possible_sequence_needs_an_unblocked_line():
+    state = new_game(1)
+    for col in range(1, 4):
+        place(state, 2, col)
+        place(state, *FILLER[col])
+    assert state.possible_sequence(2, 4, BLUE)
+    assert not state.possible_sequence(2, 4, GREEN)
+
+    # Green closes both ends, so no five-cell line through (2, 4) stays open for Blue
+    for filler, block in (((8, 8), (2, 0)), ((8, 7), (2, 5))):
+        place(state, *filler)
+        place(state, *block)
+    assert not state.possible_sequence(2, 4, BLUE)
+
+
+def test_dead_card_is_discarded_and_turn_continues():
+    state = new_game(2)
+    card = next(card for card in state.cards if card in state.positions)
+    first, second = state.positions[card]
+    place(state, *divmod(first, 10))
+    place(state, *divmod(second, 10))
+    state.hands[0][1] = card
+
+    assert state.is_dead_card(card)
+    discard = Move(DISCARD, card, -1, -1)
+    assert discard in state.legal_moves()
+    assert state.is_legal(discard)
+
+    before = snapshot(state)
+    deck_size = len(state.deck)
+    state.apply(discard)
+    assert state.current_player == 0
+    assert len(state.hands[0]) == 7
+    assert len(state.deck) == deck_size - 1
+    state.undo(discard)
+    assert snapshot(state) == before
+
+
+def test_live_card_cannot_be_discarded():
+    state = new_game(2)
+    card = next(card for card in state.cards if card in state.positions)
+    state.hands[0][0] = card
+    assert not state.is_dead_card(card)
+    assert not state.is_legal(Move(DISCARD, card, -1, -1))